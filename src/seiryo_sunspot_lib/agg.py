@@ -15,14 +15,22 @@ def convert_number(df: pl.LazyFrame) -> pl.LazyFrame:
 
 def convert_date(df: pl.LazyFrame) -> pl.LazyFrame:
     """日付を文字列から日付のデータに変換"""
+    groups = pl.col("date").str.extract_groups(
+        r"^(?P<year>[0-9]{4})"
+        r"[-/\. ](?P<month>[0-9]{1,2})"
+        r"[-/\. ](?P<day>[0-9]{1,2})$"
+    )
     return df.with_columns(
-        pl.col("date").str.replace_all(r"([-/\.])", " ").str.split(by=" ")
-    ).with_columns(
-        pl.date(
-            pl.col("date").list.get(0),
-            pl.col("date").list.get(1),
-            pl.col("date").list.get(2),
+        pl.concat_str(
+            groups.struct.field("year"),
+            groups.struct.field("month"),
+            groups.struct.field("day"),
+            separator="-",
         )
+        # 形式に合わない日付は元の文字列のまま厳密に変換して失敗させる
+        .fill_null(pl.col("date"))
+        .alias("date")
+        .str.to_date("%Y-%m-%d", strict=True)
     )
 
 
@@ -46,6 +54,9 @@ def convert_coord(
     pat_right = r"(?P<right>\d{1,3}(?:\.\d+)?)"
     pat_right = f"{pat_right_sign}{pat_right}"
     pat = f"(?i)(?:ND|{pat_left}(?:~{pat_right})?)"
+    left_sign = pl.col("left_sign").str.to_lowercase()
+    right_sign = pl.col("right_sign").str.to_lowercase()
+    chars_minus = {"s", "w", "m", "-"}
     return (
         df.with_columns(
             # 正規表現で構造体へ分解
@@ -53,41 +64,33 @@ def convert_coord(
         )
         .unnest(col)  # 構造体から列へ分解
         .with_columns(
-            # 符号の文字を小文字へ変換
-            pl.col("left_sign", "right_sign").str.to_lowercase()
-        )
-        .with_columns(
-            # 右の符号と数値が存在しなければ左で埋める
-            pl.col("right_sign").fill_null(pl.col("left_sign")),
-            pl.col("right").fill_null(pl.col("left")),
-        )
-        .with_columns(
-            # 右の符号が存在せず、左の符号が東西南北のマイナスの場合
-            # 右の符号を左の符号で埋める
+            # 文字の符号を数式の符号へ変換
+            # 右の符号が存在しなければ左の符号で埋め、
+            # 右の符号が空で左の符号が東西南北のマイナスの場合はマイナスとする
+            pl.when(left_sign.is_in(chars_minus))
+            .then(pl.lit("-"))
+            .otherwise(pl.lit("+"))
+            .alias("left_sign"),
             pl.when(
-                pl.col("right_sign").eq("")
-                & pl.col("left_sign").is_in({"s", "w"})
+                right_sign.fill_null(left_sign).is_in(chars_minus)
+                | (right_sign.eq("") & left_sign.is_in({"s", "w"}))
             )
             .then(pl.lit("-"))
-            .otherwise(pl.col("right_sign"))
-            .alias("right_sign")
-        )
-        .collect()
-        .lazy()
-        .with_columns(
-            # 文字の符号を数式の符号へ変換
-            pl.col("left_sign", "right_sign").str.replace_many(
-                ["n", "s", "e", "w", "p", "m"], ["+", "-", "+", "-", "+", "-"]
-            )
-        )
-        .with_columns(
-            # 符号を数値へ反映
-            pl.concat_str("left_sign", "left").alias("left"),
-            pl.concat_str("right_sign", "right").alias("right"),
+            .otherwise(pl.lit("+"))
+            .alias("right_sign"),
+            # 右の数値が存在しなければ左で埋める
+            pl.col("right").fill_null(pl.col("left")),
         )
         .with_columns(
-            # 文字列から小数へ変換し、四捨五入
-            pl.col("left", "right").cast(pl.Float64).round()
+            # 符号を数値へ反映し、文字列から小数へ変換して四捨五入
+            pl.concat_str("left_sign", "left")
+            .cast(pl.Float64)
+            .round()
+            .alias("left"),
+            pl.concat_str("right_sign", "right")
+            .cast(pl.Float64)
+            .round()
+            .alias("right"),
         )
         .with_columns(
             # 最大値と最小値を算出し、整数へ変換
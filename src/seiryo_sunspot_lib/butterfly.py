@@ -1,11 +1,23 @@
 import json
 from dataclasses import asdict, dataclass, fields
 from datetime import date
+from functools import cache
 from typing import TypedDict
 
 import polars as pl
 
 
+@cache
+def _format_delta(
+    years: int, months: int, days: int, units: tuple[str, str, str]
+) -> str:
+    return "".join(
+        f"{time}{unit}"
+        for time, unit in zip((years, months, days), units, strict=True)
+        if time != 0
+    )
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DateDelta:
     """日付の間隔"""
@@ -22,11 +34,12 @@ class DateDelta:
         ValueError
             入力値が不正値の時に送出
         """
-        values = self.to_dict().values()
-        if all(value == 0 for value in values):
+        # 負の値が一つでもあれば論理和は負、全て0なら論理和も0となる
+        total = self.years | self.months | self.days
+        if total == 0:
             msg = "all parameters cannot be zero"
             raise ValueError(msg)
-        if any(value < 0 for value in values):
+        if total < 0:
             msg = "parameters cannot be negative"
             raise ValueError(msg)
 
@@ -40,9 +53,6 @@ class DateDelta:
         """
         return asdict(self)
 
-    def _format_time(self: "DateDelta", time: int, unit: str) -> str:
-        return f"{time}{unit}" if time != 0 else ""
-
     def to_interval(self: "DateDelta") -> str:
         """Polarsが受け取る期間の文字列へ変換
 
@@ -51,10 +61,9 @@ class DateDelta:
         str
             変換後の文字列
         """
-        years = self._format_time(self.years, "y")
-        months = self._format_time(self.months, "mo")
-        days = self._format_time(self.days, "d")
-        return f"{years}{months}{days}"
+        return _format_delta(
+            self.years, self.months, self.days, ("y", "mo", "d")
+        )
 
     def isoformat(self: "DateDelta") -> str:
         """ISO8601の形式へ変換
@@ -64,30 +73,44 @@ class DateDelta:
         str
             変換後の文字列
         """
-        years = self._format_time(self.years, "Y")
-        months = self._format_time(self.months, "M")
-        days = self._format_time(self.days, "D")
-        return f"P{years}{months}{days}"
+        return "P" + _format_delta(
+            self.years, self.months, self.days, ("Y", "M", "D")
+        )
 
     @classmethod
     def fromisoformat(cls: type["DateDelta"], data: str) -> "DateDelta":
-        data = data.removeprefix("P")
-        if "Y" in data:
-            y_s, data = data.split("Y")
-            y = int(y_s)
-        else:
-            y = 0
-        if "M" in data:
-            m_s, data = data.split("M")
-            m = int(m_s)
-        else:
-            m = 0
-        if "D" in data:
-            d_s, data = data.split("D")
-            d = int(d_s)
-        else:
-            d = 0
-        return cls(years=y, months=m, days=d)
+        """ISO8601の形式から変換
+
+        Parameters
+        ----------
+        data : str
+            ISO8601の形式の文字列
+
+        Returns
+        -------
+        DateDelta
+            変換後の日付の間隔
+
+        Raises
+        ------
+        ValueError
+            不正な文字列の時に送出
+        """
+        msg = f"invalid isoformat string: {data!r}"
+        units = "YMD"
+        values = [0, 0, 0]
+        pos = 0  # 次に現れてよい単位の位置
+        n: int | None = None  # 単位の前の数値
+        for c in data.removeprefix("P"):
+            if "0" <= c <= "9":
+                n = (n or 0) * 10 + int(c)
+            elif n is not None and (i := units.find(c, pos)) != -1:
+                values[i], n, pos = n, None, i + 1
+            else:
+                raise ValueError(msg)
+        if n is not None:
+            raise ValueError(msg)
+        return cls(years=values[0], months=values[1], days=values[2])
 
 
 class ButterflyInfoDict(TypedDict):
@@ -166,12 +189,12 @@ def calc_date_limit(df: pl.LazyFrame) -> tuple[date, date]:
     tuple[date, date]
         開始日と最終日
     """
-    date_range: dict[str, date] = (
+    start, end = (
         df.select(pl.min("date").alias("start"), pl.max("date").alias("end"))
         .collect()
-        .to_dicts()[0]
+        .row(0)
     )
-    return date_range["start"], date_range["end"]
+    return start, end
 
 
 def adjust_dates(start: date, end: date) -> tuple[date, date]:
@@ -238,14 +261,17 @@ def fill_lat(
         緯度データ
     """
     return (
-        pl.LazyFrame({"date": pl.date_range(start, end, interval, eager=True)})
+        pl.LazyFrame()
+        .select(pl.date_range(start, end, interval).alias("date"))
         .join(df, on="date", how="left", coalesce=True)
-        .with_columns(pl.col("min", "max").fill_null(pl.lit([])))
+        .with_columns(
+            pl.col("min", "max").fill_null(pl.lit([], dtype=pl.List(pl.Int8)))
+        )
         .sort("date")
     )
 
 
-def calc_lat(df: pl.LazyFrame, info: ButterflyInfo) -> pl.DataFrame:
+def calc_lat(df: pl.LazyFrame, info: ButterflyInfo) -> pl.LazyFrame:
     """緯度データを算出する
 
     Parameters
@@ -257,16 +283,10 @@ def calc_lat(df: pl.LazyFrame, info: ButterflyInfo) -> pl.DataFrame:
 
     Returns
     -------
-    pl.DataFrame
+    pl.LazyFrame
         緯度データ
     """
-    return (
-        df.pipe(agg_lat, interval=info.date_interval.to_interval())
-        .pipe(
-            fill_lat,
-            start=info.date_start,
-            end=info.date_end,
-            interval=info.date_interval.to_interval(),
-        )
-        .collect()
+    interval = info.date_interval.to_interval()
+    return df.pipe(agg_lat, interval=interval).pipe(
+        fill_lat, start=info.date_start, end=info.date_end, interval=interval
     )
@@ -47,8 +47,11 @@ def create_lat_index(lat_min: int, lat_max: int) -> npt.NDArray[np.int8]:
     npt.NDArray[np.int8]
         緯度のインデックス
     """
-    lat_range = np.arange(lat_min, lat_max + 1, 1, dtype=np.int8)[::-1]
-    return np.insert(np.abs(lat_range), np.arange(1, len(lat_range)), -1)
+    lat_range = np.arange(lat_max, lat_min - 1, -1, dtype=np.int8)
+    lat_index = np.empty(lat_range.size * 2 - 1, dtype=np.int8)
+    lat_index[0::2] = np.abs(lat_range)
+    lat_index[1::2] = -1
+    return lat_index
 
 
 def draw_butterfly_diagram(
@@ -75,16 +78,16 @@ def draw_butterfly_diagram(
     )
     lat_index = create_lat_index(info.lat_min, info.lat_max)
 
-    xlabel = [
-        (i, f"{d.year}")
-        for i, d in enumerate(item.item() for item in date_index)
-        if d.month == 1 and d.year % config.index.year_interval == 0
-    ]
-    ylabel = [
-        (i, n)
-        for i, n in enumerate(lat_index)
-        if n % config.index.lat_interval == 0
-    ]
+    index, xaxis, yaxis = config.index, config.xaxis, config.yaxis
+
+    years = date_index.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = date_index.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    xlabel_pos = np.flatnonzero(
+        (months == 1) & (years % index.year_interval == 0)
+    )
+    xlabel_txt = years[xlabel_pos].astype(str)
+    ylabel_pos = np.flatnonzero(lat_index % index.lat_interval == 0)
+    ylabel_txt = lat_index[ylabel_pos].astype(str)
 
     fig = plt.figure(figsize=(config.fig_size.width, config.fig_size.height))
     ax = fig.add_subplot(111)
@@ -98,29 +101,29 @@ def draw_butterfly_diagram(
     )
 
     ax.set_xlabel(
-        config.xaxis.title.text,
-        fontfamily=config.xaxis.title.font_family,
-        fontsize=config.xaxis.title.font_size,
+        xaxis.title.text,
+        fontfamily=xaxis.title.font_family,
+        fontsize=xaxis.title.font_size,
     )
 
-    ax.set_xticks([i[0] for i in xlabel])
+    ax.set_xticks(xlabel_pos)
     ax.set_xticklabels(
-        [i[1] for i in xlabel],
-        fontfamily=config.xaxis.ticks.font_family,
-        fontsize=config.xaxis.ticks.font_size,
+        xlabel_txt,
+        fontfamily=xaxis.ticks.font_family,
+        fontsize=xaxis.ticks.font_size,
     )
 
     ax.set_ylabel(
-        config.yaxis.title.text,
-        fontfamily=config.yaxis.title.font_family,
-        fontsize=config.yaxis.title.font_size,
+        yaxis.title.text,
+        fontfamily=yaxis.title.font_family,
+        fontsize=yaxis.title.font_size,
     )
 
-    ax.set_yticks([i[0] for i in ylabel])
+    ax.set_yticks(ylabel_pos)
     ax.set_yticklabels(
-        [str(i[1]) for i in ylabel],
-        fontfamily=config.yaxis.ticks.font_family,
-        fontsize=config.yaxis.ticks.font_size,
+        ylabel_txt,
+        fontfamily=yaxis.ticks.font_family,
+        fontsize=yaxis.ticks.font_size,
     )
 
     return fig
@@ -5,43 +5,66 @@ from re import match
 import polars as pl
 
 
-def load_txt_data(path: Path) -> tuple[date, date, list[str]]:
-    with path.open("r") as f:
-        lines = f.read().splitlines()
-    if m := match(r">>(\d+)/(\d+)-(\d+)/(\d+)", lines[1]):
+def parse_date_range(line: str) -> tuple[date, date]:
+    if m := match(r">>(\d+)/(\d+)-(\d+)/(\d+)", line):
         start = date(int(m.group(1)), int(m.group(2)), 1)
         end = date(int(m.group(3)), int(m.group(4)), 1)
     else:
         msg = "invalid date range data"
         raise ValueError(msg)
+    return start, end
+
+
+def load_txt_data(path: Path) -> tuple[date, date, list[str]]:
+    with path.open("r") as f:
+        lines = f.read().splitlines()
+    start, end = parse_date_range(lines[1])
     return start, end, lines[4:]
 
 
-def extract_lat(txt: list[str]) -> pl.LazyFrame:
+def scan_txt_data(path: Path) -> tuple[date, date, pl.LazyFrame]:
+    with path.open("r") as f:
+        _ = f.readline()
+        start, end = parse_date_range(f.readline())
+    txt = pl.scan_csv(
+        path,
+        has_header=False,
+        separator="\x1f",
+        quote_char=None,
+        skip_rows=4,
+        new_columns=["txt"],
+        infer_schema=False,
+    )
+    return start, end, txt
+
+
+def extract_lat(txt: list[str] | pl.LazyFrame) -> pl.LazyFrame:
     pat = (
         r"(?P<year>\d+)/(?P<month>\d+)/(?<ns>[NS]):"
         r"(?P<lat>\d+-\d+(?: \d+-\d+)*)?"
     )
+    df = txt if isinstance(txt, pl.LazyFrame) else pl.LazyFrame({"txt": txt})
     return (
-        pl.LazyFrame({"txt": txt})
-        .select(pl.col("txt").str.extract_groups(pat))
+        df.select(pl.col("txt").str.extract_groups(pat))
         .unnest("txt")
+        .with_columns(pl.col("lat").str.split(by=" "))
+        .explode("lat")
+        .drop_nulls()
         .with_columns(
             pl.col("lat")
-            .str.split(by=" ")
-            .list.eval(pl.element().str.split(by="-"))
+            .str.split_exact("-", 1)
+            .struct.rename_fields(["left", "right"])
         )
-        .explode("lat")
-        .drop_nulls()
-        .cast({"lat": pl.List(pl.Int8)})
+        .unnest("lat")
+        .cast({"left": pl.Int8, "right": pl.Int8})
         .with_columns(
             pl.when(pl.col("ns").eq("N"))
-            .then(pl.col("lat"))
-            .otherwise(pl.col("lat").list.eval(-pl.element()))
+            .then(pl.col("left", "right"))
+            .otherwise(-pl.col("left", "right"))
         )
         .select(
             pl.date("year", "month", 1).alias("date"),
-            pl.col("lat").list.min().alias("lat_min"),
-            pl.col("lat").list.max().alias("lat_max"),
+            pl.min_horizontal("left", "right").alias("lat_min"),
+            pl.max_horizontal("left", "right").alias("lat_max"),
         )
     )
@@ -5,16 +5,19 @@ import polars as pl
 from seiryo_sunspot_lib.butterfly import ButterflyInfo
 
 
-def create_line(
-    data_min: list[int], data_max: list[int], lat_min: int, lat_max: int
-) -> npt.NDArray[np.uint8]:
-    """蝶形図の一列分のデータを作成する
+def _calc_line_index(
+    arr_min: npt.NDArray[np.int_],
+    arr_max: npt.NDArray[np.int_],
+    lat_min: int,
+    lat_max: int,
+) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.bool_]]:
+    """一列分のデータの行のインデックスを算出する
 
     Parameters
     ----------
-    data_min : list[int]
+    arr_min : npt.NDArray[np.int_]
         データの最小値
-    data_max : list[int]
+    arr_max : npt.NDArray[np.int_]
         データの最大値
     lat_min : int
         緯度の最小値
@@ -23,19 +26,15 @@ def create_line(
 
     Returns
     -------
-    npt.NDArray[np.uint8]
-        一列分のデータ
+    tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.bool_]]
+        範囲内のデータの行のインデックスの始点と終点、範囲内のデータの位置
     """
-    # numpy配列に変換
-    arr_min = np.array(data_min)
-    arr_max = np.array(data_max)
-
-    # 範囲外のインデックス
-    index_outer = (arr_max < lat_min) | (lat_max < arr_min)
+    # 範囲内のインデックス
+    index_inner = ~((arr_max < lat_min) | (lat_max < arr_min))
 
     # 範囲外のデータを除去
-    arr_min = arr_min[~index_outer]
-    arr_max = arr_max[~index_outer]
+    arr_min = arr_min[index_inner]
+    arr_max = arr_max[index_inner]
 
     # 緯度のインデックスの最大値
     max_index = 2 * (lat_max - lat_min)
@@ -51,14 +50,78 @@ def create_line(
     index_min = np.clip(index_min, 0, max_index)
     index_max = np.clip(index_max, 1, max_index + 1)
 
+    return index_min, index_max, index_inner
+
+
+def create_line(
+    data_min: list[int], data_max: list[int], lat_min: int, lat_max: int
+) -> npt.NDArray[np.uint8]:
+    """蝶形図の一列分のデータを作成する
+
+    Parameters
+    ----------
+    data_min : list[int]
+        データの最小値
+    data_max : list[int]
+        データの最大値
+    lat_min : int
+        緯度の最小値
+    lat_max : int
+        緯度の最大値
+
+    Returns
+    -------
+    npt.NDArray[np.uint8]
+        一列分のデータ
+    """
+    index_min, index_max, _ = _calc_line_index(
+        np.array(data_min, dtype=np.int_),
+        np.array(data_max, dtype=np.int_),
+        lat_min,
+        lat_max,
+    )
+
     # 行を埋める
-    line = np.zeros(max_index + 1, dtype=np.uint8)
+    line = np.zeros(2 * (lat_max - lat_min) + 1, dtype=np.uint8)
     for i_min, i_max in zip(index_min, index_max, strict=False):
         line[i_min:i_max] = 1
 
     return line
 
 
+def _calc_image_index(
+    df_flat: pl.DataFrame, info: ButterflyInfo
+) -> tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.int_]]:
+    """展開済みの緯度データから埋めるマスのインデックスを算出する
+
+    Parameters
+    ----------
+    df_flat : pl.DataFrame
+        列番号付きで範囲ごとの行へ展開した緯度データ
+    info : ButterflyInfo
+        蝶形図の情報
+
+    Returns
+    -------
+    tuple[npt.NDArray[np.int_], npt.NDArray[np.int_], npt.NDArray[np.int_]]
+        埋めるマスの行と列のインデックス、元のデータの行のインデックス
+    """
+    arr_col = df_flat.get_column("col").to_numpy()
+    index_min, index_max, index_inner = _calc_line_index(
+        df_flat.get_column("min").to_numpy().astype(np.int_),
+        df_flat.get_column("max").to_numpy().astype(np.int_),
+        info.lat_min,
+        info.lat_max,
+    )
+
+    # 範囲を1マスずつのインデックスへ展開
+    lengths = np.maximum(index_max - index_min, 0)
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    rows = np.repeat(index_min, lengths) + np.arange(lengths.sum()) - offsets
+    src = np.repeat(np.flatnonzero(index_inner), lengths)
+    return rows, arr_col[src].astype(np.int_), src
+
+
 def create_image(
     df: pl.DataFrame, info: ButterflyInfo
 ) -> npt.NDArray[np.uint8]:
@@ -76,10 +139,52 @@ def create_image(
     npt.NDArray[np.uint8]
         蝶形図の画像データ
     """
-    lines: list[npt.NDArray[np.uint8]] = []
-    for data in df.iter_rows(named=True):
-        data_min: list[int] = data["min"]
-        data_max: list[int] = data["max"]
-        line = create_line(data_min, data_max, info.lat_min, info.lat_max)
-        lines.append(line.reshape(-1, 1))
-    return np.hstack(lines)
+    # 列番号を付けて範囲ごとの行へ展開
+    df_flat = (
+        df.select("min", "max")
+        .with_row_index("col")
+        .explode("min", "max")
+        .drop_nulls()
+    )
+    rows, cols, _ = _calc_image_index(df_flat, info)
+
+    img = np.zeros(
+        (2 * (info.lat_max - info.lat_min) + 1, df.height), dtype=np.uint8
+    )
+    img[rows, cols] = 1
+    return img
+
+
+def create_coded_image(
+    df: pl.DataFrame, info: ButterflyInfo
+) -> npt.NDArray[np.uint16]:
+    """符号付きの緯度データから蝶形図のデータを作成する
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        符号付きの緯度データ
+    info : ButterflyInfo
+        蝶形図の情報
+
+    Returns
+    -------
+    npt.NDArray[np.uint16]
+        蝶形図の画像データ
+    """
+    # 列番号を付けて範囲ごとの行へ展開
+    df_flat = (
+        df.select("min", "max", "code")
+        .with_row_index("col")
+        .explode("min", "max", "code")
+        .drop_nulls()
+    )
+    rows, cols, src = _calc_image_index(df_flat, info)
+    codes = df_flat.get_column("code").to_numpy()[src]
+
+    # 符号の論理和で埋める
+    img = np.zeros(
+        (2 * (info.lat_max - info.lat_min) + 1, df.height), dtype=np.uint16
+    )
+    np.bitwise_or.at(img, (rows, cols), codes)
+    return img
@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 import numpy as np
 import numpy.typing as npt
 import polars as pl
@@ -8,16 +10,21 @@ from seiryo_sunspot_lib.butterfly_config import ColorMap
 
 
 def merge_info(info_list: list[ButterflyInfo]) -> ButterflyInfo:
-    if len({info.date_interval for info in info_list}) != 1:
-        msg = "Date interval must be equal"
+    msg = "Date interval must be equal"
+    if len(info_list) == 0:
         raise ValueError(msg)
-    lat_min = min(info.lat_min for info in info_list)
-    lat_max = max(info.lat_max for info in info_list)
-    date_start = min(info.date_start for info in info_list)
-    date_end = max(info.date_end for info in info_list)
-    return ButterflyInfo(
-        lat_min, lat_max, date_start, date_end, info_list[0].date_interval
-    )
+    first = info_list[0]
+    interval = first.date_interval
+    lat_min, lat_max = first.lat_min, first.lat_max
+    date_start, date_end = first.date_start, first.date_end
+    for info in info_list[1:]:
+        if info.date_interval != interval:
+            raise ValueError(msg)
+        lat_min = min(lat_min, info.lat_min)
+        lat_max = max(lat_max, info.lat_max)
+        date_start = min(date_start, info.date_start)
+        date_end = max(date_end, info.date_end)
+    return ButterflyInfo(lat_min, lat_max, date_start, date_end, interval)
 
 
 def calc_lat_size(info: ButterflyInfo) -> int:
@@ -34,33 +41,45 @@ def calc_date_size(info: ButterflyInfo) -> int:
 
 
 def create_merged_image(
-    dfl: list[pl.DataFrame], info: ButterflyInfo
+    dfl: Sequence[pl.DataFrame | pl.LazyFrame], info: ButterflyInfo
 ) -> npt.NDArray[np.uint16]:
-    lat_size = calc_lat_size(info)
-    date_size = calc_date_size(info)
-    img: npt.NDArray[np.uint16] = np.zeros(
-        (lat_size, date_size), dtype=np.uint16
+    if len(dfl) == 0:
+        return np.zeros(
+            (calc_lat_size(info), calc_date_size(info)), dtype=np.uint16
+        )
+    interval = info.date_interval.to_interval()
+    df_coded = (
+        pl.concat(
+            [
+                df.lazy()
+                .explode("min", "max")
+                .drop_nulls()
+                .with_columns(pl.lit(1 << i, dtype=pl.UInt16).alias("code"))
+                for i, df in enumerate(dfl)
+            ]
+        )
+        .group_by("date")
+        .agg("min", "max", "code")
+        .pipe(
+            butterfly.fill_lat,
+            start=info.date_start,
+            end=info.date_end,
+            interval=interval,
+        )
+        .with_columns(
+            pl.col("code").fill_null(pl.lit([], dtype=pl.List(pl.UInt16)))
+        )
+        .collect()
     )
-    for i, df in enumerate(dfl):
-        img = img + (
-            butterfly_image.create_image(
-                butterfly.fill_lat(
-                    df.lazy(),
-                    info.date_start,
-                    info.date_end,
-                    info.date_interval.to_interval(),
-                ).collect(),
-                info,
-            )
-            << i
-        ).astype(np.uint16)
-    return img
+    return butterfly_image.create_coded_image(df_coded, info)
 
 
 def create_color_image(
     img: npt.NDArray[np.uint16], cmap: ColorMap
 ) -> npt.NDArray[np.uint8]:
-    img_merged = np.full((*img.shape, 3), 0xFF, dtype=np.uint8)
+    size = max(len(cmap.cmap), int(img.max(initial=0))) + 1
+    palette = np.full((size, 3), 0xFF, dtype=np.uint8)
     for i, c in enumerate(cmap.cmap, 1):
-        img_merged[img == i] = (c.red, c.green, c.blue)
+        palette[i] = (c.red, c.green, c.blue)
+    img_merged: npt.NDArray[np.uint8] = palette[img]
     return img_merged
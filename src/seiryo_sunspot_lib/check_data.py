@@ -2,6 +2,18 @@ import polars as pl
 
 
 def create_expected_group_numbers(no: int) -> pl.Series:
+    """期待されるグループ番号の列を作成する
+
+    Parameters
+    ----------
+    no : int
+        グループの数
+
+    Returns
+    -------
+    pl.Series
+        1からグループの数までの番号
+    """
     return pl.Series(range(1, no + 1), dtype=pl.UInt8)
 
 
@@ -18,22 +30,32 @@ def find_invalid_group_number(df: pl.DataFrame) -> pl.DataFrame:
     pl.DataFrame
         不正値を含む行のみの新しいデータフレーム
     """
+    no = pl.col("no")
     return (
         df.lazy()
         .group_by("date")
         .agg(
-            pl.col("no").alias("original"),
-            pl.col("no")
-            .count()
-            .map_elements(
-                create_expected_group_numbers, return_dtype=pl.List(pl.UInt8)
-            )
-            .alias("expected"),
+            no.sort().alias("original"),
+            no.count().alias("count"),
+            # 重複や欠番がなく1から始まる連番かどうか
+            (
+                no.null_count().eq(0)
+                & no.n_unique().eq(pl.len())
+                & no.min().eq(1)
+                & no.max().eq(pl.len())
+            ).alias("valid"),
+            # 黒点群が存在しない日かどうか
+            (pl.len().eq(1) & no.first().eq(0))
+            .fill_null(value=False)
+            .alias("zero"),
         )
-        .with_columns(pl.col("original", "expected").list.sort())
-        .filter(
-            (pl.col("original") != pl.col("expected"))
-            & (pl.col("original") != [0])
+        .filter(~pl.col("valid") & ~pl.col("zero"))
+        .select(
+            "date",
+            "original",
+            pl.int_ranges(1, pl.col("count") + 1, dtype=pl.UInt8).alias(
+                "expected"
+            ),
         )
         .collect()
     )
@@ -1,22 +1,25 @@
+import heapq
 import re
-from collections.abc import Iterable
-from csv import DictReader
+from collections.abc import Iterable, Iterator
+from csv import reader as csv_reader
 from datetime import date
 from typing import Literal, TypeAlias, TypedDict
 
+import polars as pl
+
 _pat_case = r"(?i)"
-_pat_number = r"\d+"
+_pat_number = r"[0-9]+"
 _pat_date = (
-    r"(?P<year>\d{4})"
+    r"(?P<year>[0-9]{4})"
     r"(?P<sep1>[-/\. ])"
-    r"(?P<month>\d{1,2})"
+    r"(?P<month>[0-9]{1,2})"
     r"(?P<sep2>[-/\. ])"
-    r"(?P<day>\d{1,2})"
+    r"(?P<day>[0-9]{1,2})"
 )
-_pat_lat_left = r"(?P<left>\d{1,2}(?:\.\d+)?)"
-_pat_lat_right = r"(?P<right>\d{1,2}(?:\.\d+)?)"
-_pat_lon_left = r"(?P<left>\d{1,3}(?:\.\d+)?)"
-_pat_lon_right = r"(?P<right>\d{1,3}(?:\.\d+)?)"
+_pat_lat_left = r"(?P<left>[0-9]{1,2}(?:\.[0-9]+)?)"
+_pat_lat_right = r"(?P<right>[0-9]{1,2}(?:\.[0-9]+)?)"
+_pat_lon_left = r"(?P<left>[0-9]{1,3}(?:\.[0-9]+)?)"
+_pat_lon_right = r"(?P<right>[0-9]{1,3}(?:\.[0-9]+)?)"
 _pat_lat_left_sign = r"(?P<left_sign>[nspm+-]?)"
 _pat_lat_right_sign = r"(?P<right_sign>[nspm+-]?)"
 _pat_lon_left_sign = r"(?P<left_sign>[ewpm+-]?)"
@@ -31,13 +34,12 @@ _pat_lon = (
     rf"(?:~{_pat_lon_right_sign}{_pat_lon_right})?"
 )
 _pat_lon = rf"{_pat_case}(?P<not_detected>ND|{_pat_lon})"
-_patterns = {
-    "date": re.compile(_pat_date),
-    "no": re.compile(_pat_number),
-    "lat": re.compile(_pat_lat),
-    "lon": re.compile(_pat_lon),
-    "num": re.compile(_pat_number),
-}
+_PAT_DATE = re.compile(_pat_date)
+_PAT_NO = re.compile(_pat_number)
+_PAT_LAT = re.compile(_pat_lat)
+_PAT_LON = re.compile(_pat_lon)
+_PAT_NUM_POS = re.compile(_pat_number)
+_FIELDS = ["date", "no", "lat", "lon", "num"]
 
 
 class ErrHeader(TypedDict):
@@ -84,8 +86,7 @@ def validate_date(s: str) -> bool:
     >>> validate_date("2020/13/42")
     False
     """
-    pattern = _patterns["date"]
-    if match := pattern.fullmatch(s):
+    if match := _PAT_DATE.fullmatch(s):
         groups = match.groupdict()
         if groups["sep1"] == groups["sep2"]:
             try:
@@ -119,8 +120,7 @@ def validate_no(s: str) -> bool:
     >>> validate_no("-2")
     False
     """
-    pattern = _patterns["no"]
-    return bool(pattern.fullmatch(s))
+    return _PAT_NO.fullmatch(s) is not None
 
 
 def validate_lat(s: str) -> bool:
@@ -161,9 +161,8 @@ def validate_lat(s: str) -> bool:
     >>> validate_lat("N6~-6")
     False
     """
-    pattern = _patterns["lat"]
     lat_max = 90
-    if match := pattern.fullmatch(s):
+    if match := _PAT_LAT.fullmatch(s):
         groups = match.groupdict()
         if groups["not_detected"].lower() == "nd":
             return True
@@ -215,9 +214,8 @@ def validate_lon(s: str) -> bool:
     >>> validate_lon("12~W15")
     False
     """
-    pattern = _patterns["lon"]
     lon_max = 360
-    if match := pattern.fullmatch(s):
+    if match := _PAT_LON.fullmatch(s):
         groups = match.groupdict()
         if groups["not_detected"].lower() == "nd":
             return True
@@ -261,11 +259,8 @@ def validate_num(s: str) -> bool:
     >>> validate_num("-12")
     False
     """
-    pattern = re.compile(r"\d+")
-    if match := pattern.fullmatch(s):
-        num = match.group()
-        return int(num) > 0
-    return False
+    match = _PAT_NUM_POS.fullmatch(s)
+    return match is not None and int(match.group()) > 0
 
 
 def validate_row(row: dict[str, str | None], *, first: bool) -> list[str]:
@@ -309,43 +304,253 @@ def validate_row(row: dict[str, str | None], *, first: bool) -> list[str]:
     return errors
 
 
-def validate_file(file: Iterable[str]) -> list[Error]:
+def _expr_date(col: str) -> pl.Expr:
+    """日付の列が妥当か検査する式
+
+    Parameters
+    ----------
+    col : str
+        列名
+
+    Returns
+    -------
+    pl.Expr
+        妥当であれば真となる式
+    """
+    groups = pl.col(col).str.extract_groups(f"^{_pat_date}$")
+    year = groups.struct.field("year")
+    month = groups.struct.field("month").str.zfill(2)
+    day = groups.struct.field("day").str.zfill(2)
+    return (
+        groups.struct.field("sep1").eq(groups.struct.field("sep2"))
+        & year.cast(pl.Int32).ge(date.min.year)
+        & pl.concat_str(year, month, day)
+        .str.to_date("%Y%m%d", strict=False)
+        .is_not_null()
+    ).fill_null(value=False)
+
+
+def _expr_coord(
+    col: str, pattern: str, chars_dir: set[str], coord_max: int
+) -> pl.Expr:
+    """経緯度の列が妥当か検査する式
+
+    Parameters
+    ----------
+    col : str
+        列名
+    pattern : str
+        経緯度の正規表現
+    chars_dir : set[str]
+        方角を表す文字
+    coord_max : int
+        経緯度の最大値
+
+    Returns
+    -------
+    pl.Expr
+        妥当であれば真となる式
+    """
+    groups = pl.col(col).str.extract_groups(f"^(?:{pattern})$")
+    not_detected = groups.struct.field("not_detected").str.to_lowercase()
+    left_sign = groups.struct.field("left_sign").str.to_lowercase()
+    right_sign = groups.struct.field("right_sign").str.to_lowercase()
+    left = groups.struct.field("left").cast(pl.Float64)
+    right = groups.struct.field("right").cast(pl.Float64)
+    chars_sign = {"p", "m", "+", "-", ""}
+    left_in_range = left.is_between(0, coord_max)
+    right_in_range = right.is_between(0, coord_max)
+    return (
+        not_detected.eq("nd")
+        | (right.is_null() & left_in_range)
+        | (
+            left_sign.is_in(chars_dir)
+            & right_sign.is_in(chars_dir | {""})
+            & left_in_range
+            & right_in_range
+        )
+        | (
+            left_sign.is_in(chars_sign)
+            & right_sign.is_in(chars_sign)
+            & left_in_range
+            & right_in_range
+        )
+        | (
+            left_sign.eq("")
+            & right_sign.is_in(chars_dir)
+            & left.eq(0)
+            & right_in_range
+        )
+    ).fill_null(value=False)
+
+
+def _expr_no_invalid() -> pl.Expr:
+    """番号の列が不正か検査する式
+
+    Returns
+    -------
+    pl.Expr
+        不正であれば真となる式
+    """
+    return ~pl.col("no").str.contains(f"^{_pat_number}$").fill_null(
+        value=False
+    )
+
+
+def _expr_field(col: str, valid: pl.Expr) -> pl.Expr:
+    """番号に応じて黒点群の列が不正か検査する式
+
+    番号が0であれば空欄、それ以外であれば妥当な値を要求する
+
+    Parameters
+    ----------
+    col : str
+        列名
+    valid : pl.Expr
+        列の値が妥当であれば真となる式
+
+    Returns
+    -------
+    pl.Expr
+        不正であれば真となる式
+    """
+    return (
+        ~_expr_no_invalid()
+        & pl.when(pl.col("no").str.contains("^0+$"))
+        .then(pl.col(col).ne("").fill_null(value=True))
+        .otherwise(~valid.fill_null(value=False))
+    ).alias(col)
+
+
+def validate_lat_series(s: pl.Series) -> pl.Series:
+    """緯度の列全体が妥当か一括で検査
+
+    Parameters
+    ----------
+    s : pl.Series
+        入力された文字列の列
+
+    Returns
+    -------
+    pl.Series
+        各要素の結果
+    """
+    return (
+        s.to_frame("lat")
+        .select(_expr_coord("lat", _pat_lat, {"n", "s"}, 90).alias(s.name))
+        .to_series()
+    )
+
+
+def validate_lon_series(s: pl.Series) -> pl.Series:
+    """経度の列全体が妥当か一括で検査
+
+    Parameters
+    ----------
+    s : pl.Series
+        入力された文字列の列
+
+    Returns
+    -------
+    pl.Series
+        各要素の結果
+    """
+    return (
+        s.to_frame("lon")
+        .select(_expr_coord("lon", _pat_lon, {"e", "w"}, 360).alias(s.name))
+        .to_series()
+    )
+
+
+def validate_file(
+    file: Iterable[str], *, skip_over: bool = False
+) -> list[Error]:
     """CSVファイル全体が妥当か検査
 
     Parameters
     ----------
     file : Iterable[str]
         CSVファイル
+    skip_over : bool, default False
+        列が多すぎる行の各列の検査を省略するかどうか
 
     Returns
     -------
     list[dict]
         不正と検出された箇所と種類
     """
-    reader = DictReader(file, restkey="over", strict=True)
+    reader = csv_reader(file, strict=True)
 
-    fields = reader.fieldnames
-    if fields is None or fields != ["date", "no", "lat", "lon", "num"]:
-        header = None if fields is None else list(fields)
+    header = next(reader, None)
+    if header != _FIELDS:
         return [{"error_type": "header", "header": header}]
 
-    first = True
-    errors: list[Error] = []
+    first_line: int | None = None
+    lines: list[int] = []
+    rows: list[list[str | None]] = []
+    errors_row: list[ErrRow] = []
     for row in reader:
-        if "over" in row:
-            errors.append(
+        if len(row) == 0:
+            continue
+        if first_line is None:
+            first_line = reader.line_num
+        if len(row) > len(_FIELDS):
+            errors_row.append(
                 {
                     "error_type": "row",
                     "line": reader.line_num,
-                    "over": list(row["over"]),
+                    "over": row[len(_FIELDS) :],
                 }
             )
+            if skip_over:
+                continue
+        lines.append(reader.line_num)
+        rows.append(
+            [*row[: len(_FIELDS)]] + [None] * (len(_FIELDS) - len(row))
+        )
 
-        if len(ret := validate_row(row, first=first)) != 0:
-            errors.append(
-                {"error_type": "field", "line": reader.line_num, "fields": ret}
-            )
-
-        if first:
-            first = False
-    return errors
+    df = pl.DataFrame(
+        rows, schema=dict.fromkeys(_FIELDS, pl.String), orient="row"
+    ).with_columns(pl.Series("line", lines, dtype=pl.UInt32))
+
+    df_invalid = (
+        df.lazy()
+        .select(
+            "line",
+            (
+                pl.col("date").is_null()
+                | (
+                    ~_expr_date("date")
+                    & (
+                        pl.col("line").eq(pl.lit(first_line, dtype=pl.UInt32))
+                        | pl.col("date").ne("")
+                    )
+                )
+            ).alias("date"),
+            _expr_no_invalid().alias("no"),
+            _expr_field("lat", _expr_coord("lat", _pat_lat, {"n", "s"}, 90)),
+            _expr_field("lon", _expr_coord("lon", _pat_lon, {"e", "w"}, 360)),
+            _expr_field(
+                "num",
+                pl.col("num").str.contains(f"^{_pat_number}$")
+                & pl.col("num").str.contains("[1-9]"),
+            ),
+        )
+        .filter(pl.any_horizontal(_FIELDS))
+        .collect()
+    )
+
+    errors_field: list[ErrFields] = [
+        {
+            "error_type": "field",
+            "line": row["line"],
+            "fields": [field for field in _FIELDS if row[field]],
+        }
+        for row in df_invalid.iter_rows(named=True)
+    ]
+
+    # どちらも行番号順のため、順序を保って併合する
+    errors: Iterator[ErrRow | ErrFields] = heapq.merge(
+        errors_row, errors_field, key=lambda error: error["line"]
+    )
+    return list(errors)
@@ -1,39 +1,125 @@
 import re
-from csv import DictReader
+from csv import reader as csv_reader
 from pathlib import Path
 
+import polars as pl
 from pydantic import BaseModel
 
+_pat_date = (
+    r"^(?P<year>[0-9]{4})"
+    r"(?:[-/\. ])"
+    r"(?P<month>[0-9]{1,2})"
+    r"(?:[-/\. ])"
+    r"(?P<day>[0-9]{1,2})$"
+)
+_PAT_DATE = re.compile(_pat_date)
+
 
 class FinderResult(BaseModel):
     path: str
     lines: list[int]
 
 
+def _find_lines(path: Path, year: int, month: int, day: int) -> list[int]:
+    """Polarsで日付が一致する行番号を検索する
+
+    Parameters
+    ----------
+    path : Path
+        CSVファイルのパス
+    year : int
+        年
+    month : int
+        月
+    day : int
+        日
+
+    Returns
+    -------
+    list[int]
+        一致した行番号
+
+    Raises
+    ------
+    pl.exceptions.ComputeError
+        列が多すぎる行などでPolarsが読み込めない時に送出
+    """
+    return (
+        pl.scan_csv(path, infer_schema=False)
+        .with_row_index("line", offset=2)  # ヘッダと1始まりの分
+        .select(
+            # 引用符内の改行の分だけ後の行番号をずらす
+            pl.col("line")
+            + pl.sum_horizontal(
+                pl.exclude("line").str.count_matches("\n", literal=True)
+            ).cum_sum(),
+            pl.col("date")
+            .str.extract_groups(_pat_date)
+            .struct.field("year", "month", "day")
+            .cast(pl.Int32, strict=False),
+        )
+        .filter(
+            pl.col("year").eq(year),
+            pl.col("month").eq(month),
+            pl.col("day").eq(day),
+        )
+        .collect()
+        .get_column("line")
+        .to_list()
+    )
+
+
+def _find_lines_csv(path: Path, year: int, month: int, day: int) -> list[int]:
+    """csvモジュールで日付が一致する行番号を検索する
+
+    Parameters
+    ----------
+    path : Path
+        CSVファイルのパス
+    year : int
+        年
+    month : int
+        月
+    day : int
+        日
+
+    Returns
+    -------
+    list[int]
+        一致した行番号
+    """
+    lines: list[int] = []
+    with path.open("r", newline="") as f:
+        reader = csv_reader(f)
+        header = next(reader, [])
+        if "date" not in header:
+            return lines
+        index = header.index("date")
+        for row in reader:
+            if len(row) <= index:
+                continue
+            if (match := _PAT_DATE.match(row[index])) and (
+                int(match["year"]),
+                int(match["month"]),
+                int(match["day"]),
+            ) == (year, month, day):
+                lines.append(reader.line_num)
+    return lines
+
+
 def finder(
     search_path: Path, year: int, month: int, day: int
 ) -> list[FinderResult]:
-    pattern = re.compile(
-        r"(?P<year>\d{4})"
-        r"(?:[-/\. ])"
-        r"(?P<month>\d{1,2})"
-        r"(?:[-/\. ])"
-        r"(?P<day>\d{1,2})"
-    )
     result: list[FinderResult] = []
     for path in search_path.glob("*.csv"):
-        with path.open("r") as f:
-            reader = DictReader(f)
-            match_line_num: list[int] = []
-            for row in reader:
-                if match := pattern.fullmatch(row["date"]):
-                    groups = match.groupdict()
-                    if (
-                        int(groups["year"]) == year
-                        and int(groups["month"]) == month
-                        and int(groups["day"]) == day
-                    ):
-                        match_line_num.append(reader.line_num)
-        if len(match_line_num) != 0:
-            result.append(FinderResult(path=str(path), lines=match_line_num))
+        try:
+            lines = _find_lines(path, year, month, day)
+        except pl.exceptions.NoDataError:
+            # 空のファイルは飛ばす
+            continue
+        except pl.exceptions.ComputeError:
+            # 列が多すぎる行を含むファイルはcsvモジュールで行番号を数える
+            lines = _find_lines_csv(path, year, month, day)
+        if len(lines) != 0:
+            result.append(FinderResult(path=str(path), lines=lines))
     return result
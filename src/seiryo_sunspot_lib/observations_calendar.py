@@ -23,14 +23,29 @@ def create_calendar(
     df: pl.DataFrame, year: int, month: int, first_weekday: int = 0
 ) -> ObsCalendar:
     c = Calendar(firstweekday=first_weekday)
+    days = list(c.itermonthdates(year, month))
 
-    calendar: list[list[ObsDay]] = []
-    for week in chunked(c.itermonthdates(year, month), 7):
-        calendar.append([])
-        for day in week:
-            df_obs = df.filter(pl.col("date") == day)
-            obs = df_obs.item(0, "obs") if df_obs.height == 1 else 0
-            calendar[-1].append(ObsDay(day, obs))
+    # カレンダーの範囲の観測に絞り込んでから一意な日付の観測を結合し、
+    # 存在しなければ0とする
+    df_obs = (
+        df.lazy()
+        .select("date", "obs")
+        .filter(pl.col("date").is_between(days[0], days[-1]))
+        .filter(pl.col("date").is_unique())
+    )
+    obs = (
+        pl.LazyFrame({"date": days}, schema={"date": pl.Date})
+        .join(df_obs, on="date", how="left")
+        .sort("date")
+        .select(pl.col("obs").fill_null(0))
+        .collect()
+        .get_column("obs")
+    )
+
+    calendar: list[list[ObsDay]] = [
+        [ObsDay(day, o) for day, o in week]
+        for week in chunked(zip(days, obs.to_list(), strict=True), 7)
+    ]
 
     return {
         "year": year,
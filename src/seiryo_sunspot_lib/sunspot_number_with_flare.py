@@ -14,13 +14,14 @@ from seiryo_sunspot_lib.sunspot_number_with_flare_config import (
     SunspotNumberWithFlareHemispheric,
 )
 
+_PAT_YEAR = re.compile(r"(\d{4})")
+
 
 def load_flare_file(path: Path) -> pl.DataFrame:
     with path.open("r") as f:
-        lines = [line.strip() for line in f if line.strip()]
-    pat_year = re.compile(r"(\d{4})")
+        lines = [stripped for line in f if (stripped := line.strip())]
     for line in lines:
-        if match := pat_year.match(line):
+        if match := _PAT_YEAR.match(line):
             year = int(match.group())
             break
     else:
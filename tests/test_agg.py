@@ -80,6 +80,26 @@ def test_convert_date(in_date: str, out_date: date) -> None:
     assert_frame_equal(df_out, df_expected, check_column_order=False)
 
 
+@pytest.mark.parametrize(
+    "in_date",
+    [
+        "2020/01/010",
+        "12020/1/1",
+        "x",
+        "2020/1",
+        " 2020/1/1",
+        "2020",
+        "20200101",
+        "2020/13/1",
+        "2020/2/30",
+    ],
+)
+def test_convert_date_with_error(in_date: str) -> None:
+    df_in = pl.LazyFrame({"date": [in_date]}, schema={"date": pl.Utf8})
+    with pytest.raises(pl.exceptions.InvalidOperationError):
+        _ = agg.convert_date(df_in).collect()
+
+
 @pytest.mark.parametrize(
     ("in_data", "in_col", "in_dtype", "out_min", "out_max"),
     [
@@ -57,6 +57,14 @@ def test_date_delta_fromisoformat(
     assert delta_out == delta_expected
 
 
+@pytest.mark.parametrize(
+    "in_str", ["P1Y1Y", "P1D1Y", "P1M1Y", "P1D2", "PY", "P1X", "P1.5D"]
+)
+def test_date_delta_fromisoformat_with_error(in_str: str) -> None:
+    with pytest.raises(ValueError, match="invalid isoformat string"):
+        _ = butterfly.DateDelta.fromisoformat(in_str)
+
+
 @pytest.mark.parametrize(
     ("in_years", "in_months", "in_days", "out_error_msg"),
     [
@@ -440,5 +448,5 @@ def test_calc_lat() -> None:
             "max": pl.List(pl.Int8),
         },
     )
-    df_out = butterfly.calc_lat(df_in, info)
+    df_out = butterfly.calc_lat(df_in, info).collect()
     assert_frame_equal(df_out, df_expected)
@@ -96,6 +96,7 @@ def test_create_lat_index(
     np.testing.assert_equal(out, out_index)
 
 
+@pytest.mark.slow
 def test_draw_butterfly_diagram() -> None:
     img = np.array([[1, 1, 0], [1, 0, 0], [1, 1, 1]])
     info = butterfly.ButterflyInfo(
@@ -158,3 +158,39 @@ def test_extract_lat(
     )
     df_out = butterfly_fromtext.extract_lat(in_txt)
     assert_frame_equal(df_out, df_expected, check_row_order=False)
+
+
+def test_scan_txt_data(tmp_path: Path) -> None:
+    path = tmp_path / "butterfly.txt"
+    path.write_text(
+        "//Data File for Butterfly Diagram\n"
+        ">>1953/03-2016/06\n"
+        "\n"
+        "<----data---->\n"
+        "1953/03/N:3-5 10-10\n"
+        "1953/03/S:8-8 18-18\n"
+        "1953/04/N:\n"
+    )
+    df_expected = pl.LazyFrame(
+        {"txt": ["1953/03/N:3-5 10-10", "1953/03/S:8-8 18-18", "1953/04/N:"]},
+        schema={"txt": pl.Utf8},
+    )
+
+    start, end, df_out = butterfly_fromtext.scan_txt_data(path)
+    assert start == date(1953, 3, 1)
+    assert end == date(2016, 6, 1)
+    assert_frame_equal(df_out, df_expected)
+
+
+def test_extract_lat_from_lazyframe() -> None:
+    df_in = pl.LazyFrame({"txt": ["2020/01/N:1-2", "2020/01/S:1-2"]})
+    df_expected = pl.LazyFrame(
+        {
+            "date": [date(2020, 1, 1), date(2020, 1, 1)],
+            "lat_min": [1, -2],
+            "lat_max": [2, -1],
+        },
+        schema={"date": pl.Date, "lat_min": pl.Int8, "lat_max": pl.Int8},
+    )
+    df_out = butterfly_fromtext.extract_lat(df_in)
+    assert_frame_equal(df_out, df_expected, check_row_order=False)
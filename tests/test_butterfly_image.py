@@ -144,3 +144,36 @@ def test_create_image(
     )
     out = butterfly_image.create_image(df_in, info)
     np.testing.assert_equal(out, out_img)
+
+
+def test_create_coded_image() -> None:
+    df_in = pl.DataFrame(
+        {
+            "min": [[1, -1], [], [-1, 0]],
+            "max": [[1, 1], [], [2, 0]],
+            "code": [[1, 2], [], [4, 8]],
+        },
+        schema={
+            "min": pl.List(pl.Int8),
+            "max": pl.List(pl.Int8),
+            "code": pl.List(pl.UInt16),
+        },
+    )
+    info = butterfly.ButterflyInfo(
+        -1,
+        1,
+        date(2020, 2, 2),
+        date(2020, 2, 2),
+        butterfly.DateDelta(years=100),
+    )
+    out = butterfly_image.create_coded_image(df_in, info)
+    np.testing.assert_equal(
+        out,
+        [
+            [3, 0, 4],  # +1
+            [2, 0, 4],
+            [2, 0, 12],  # 0
+            [2, 0, 4],
+            [2, 0, 4],  # -1
+        ],
+    )
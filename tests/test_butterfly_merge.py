@@ -159,6 +159,10 @@ def test_create_merged_image(
     )
     out = butterfly_merge.create_merged_image(dfl_in, info)
     np.testing.assert_equal(out, out_img)
+    out_lazy = butterfly_merge.create_merged_image(
+        [df.lazy() for df in dfl_in], info
+    )
+    np.testing.assert_equal(out_lazy, out_img)
 
 
 @pytest.mark.parametrize(
@@ -1,4 +1,6 @@
+import polars as pl
 import pytest
+from polars.testing import assert_series_equal
 
 from seiryo_sunspot_lib import check_file
 
@@ -141,6 +143,68 @@ def test_validate_lon(in_lon: str, result: bool) -> None:
     assert check_file.validate_lon(in_lon) == result
 
 
+def test_validate_lat_series() -> None:
+    s_in = pl.Series("lat", ["N12", "3~N5", "0~N3", "100", "nd", "", None])
+    s_expected = pl.Series(
+        "lat", [True, False, True, False, True, False, False]
+    )
+    s_out = check_file.validate_lat_series(s_in)
+    assert_series_equal(s_out, s_expected)
+
+
+def test_validate_lon_series() -> None:
+    s_in = pl.Series("lon", ["W222", "3~E5", "0~E3", "E400", "ND", "", None])
+    s_expected = pl.Series(
+        "lon", [True, False, True, False, True, False, False]
+    )
+    s_out = check_file.validate_lon_series(s_in)
+    assert_series_equal(s_out, s_expected)
+
+
+@pytest.mark.parametrize(
+    "in_lat",
+    [
+        "N12",
+        "n12",
+        "p7~m3",
+        "3~N5",
+        "S3~-2",
+        "12.3~23.4",
+        "100",
+        "nd",
+        "md",
+        "",
+        "N\u0661\u0662",
+        "\u0661\u0662~\u0663",
+    ],
+)
+def test_validate_lat_series_matches_scalar(in_lat: str) -> None:
+    s_out = check_file.validate_lat_series(pl.Series("lat", [in_lat]))
+    assert s_out.item() == check_file.validate_lat(in_lat)
+
+
+@pytest.mark.parametrize(
+    "in_lon",
+    [
+        "W222",
+        "e12",
+        "p7~m3",
+        "3~E5",
+        "W3~-2",
+        "E123~234",
+        "E400",
+        "ND",
+        "md",
+        "",
+        "E\u0661\u0662",
+        "\u0661\u0662~\u0663",
+    ],
+)
+def test_validate_lon_series_matches_scalar(in_lon: str) -> None:
+    s_out = check_file.validate_lon_series(pl.Series("lon", [in_lon]))
+    assert s_out.item() == check_file.validate_lon(in_lon)
+
+
 @pytest.mark.parametrize(
     ("in_num", "result"),
     [
@@ -305,6 +369,17 @@ def test_validate_row(
                 {"error_type": "field", "line": 4, "fields": ["num"]},
             ],
         ),
+        (
+            [
+                "date,no,lat,lon,num\n",
+                "\u0662\u0660\u0662\u0660/1/1,1,N12,E3,1\n",
+                "2020/1/1,1,N\u0661\u0662,E3,1\n",
+            ],
+            [
+                {"error_type": "field", "line": 2, "fields": ["date"]},
+                {"error_type": "field", "line": 3, "fields": ["lat"]},
+            ],
+        ),
     ],
 )
 def test_validate_file(
@@ -313,3 +388,48 @@ def test_validate_file(
     ret = check_file.validate_file(in_file)
     print(ret)
     assert ret == result
+
+
+@pytest.mark.parametrize(
+    ("in_file", "in_skip_over", "result"),
+    [
+        (
+            [
+                "date,no,lat,lon,num\n",
+                ",1,W12,E2~5,3,foo\n",
+                "2020/8/20,2,N3~6,W2,4\n",
+            ],
+            False,
+            [
+                {"error_type": "row", "line": 2, "over": ["foo"]},
+                {"error_type": "field", "line": 2, "fields": ["date", "lat"]},
+            ],
+        ),
+        (
+            [
+                "date,no,lat,lon,num\n",
+                ",1,W12,E2~5,3,foo\n",
+                "2020/8/20,2,N3~6,W2,4\n",
+            ],
+            True,
+            [{"error_type": "row", "line": 2, "over": ["foo"]}],
+        ),
+        (
+            [
+                "date,no,lat,lon,num\n",
+                "2020/8/20,1,N12,E2~5,3,foo\n",
+                ",2,N3~6,W2,0\n",
+            ],
+            True,
+            [
+                {"error_type": "row", "line": 2, "over": ["foo"]},
+                {"error_type": "field", "line": 3, "fields": ["num"]},
+            ],
+        ),
+    ],
+)
+def test_validate_file_skip_over(
+    in_file: list[str], in_skip_over: bool, result: list[check_file.Error]
+) -> None:
+    ret = check_file.validate_file(in_file, skip_over=in_skip_over)
+    assert ret == result
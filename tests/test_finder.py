@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from seiryo_sunspot_lib import finder
+
+
+@pytest.mark.parametrize(
+    ("in_files", "out_result"),
+    [
+        (
+            {
+                "a.csv": "date,no,lat,lon,num\n"
+                "2020/8/20,1,N12,E2~5,3\n"
+                ",2,N3~6,W2,4\n"
+                "\n"
+                "2020/8/20,0,,,\n"
+                "2020/8/21,0,,,\n"
+                "2020-08-20,0,,,\n"
+            },
+            [{"path": "a.csv", "lines": [2, 5, 7]}],
+        ),
+        (
+            {
+                "a.csv": "date,no,lat,lon,num\n"
+                '2020/8/20,1,"N12\n'
+                'N13",E2~5,3\n'
+                "2020/8/20,0,,,\n"
+            },
+            [{"path": "a.csv", "lines": [3, 4]}],
+        ),
+        (
+            {
+                "a.csv": "date,no,lat,lon,num\n"
+                '2020/8/21,0,,,,"a\n'
+                'b"\n'
+                "2020/8/20,0,,,\n"
+                "2020/8/20,0\n"
+            },
+            [{"path": "a.csv", "lines": [4, 5]}],
+        ),
+        (
+            {
+                "a.csv": "date,no,lat,lon,num\n",
+                "b.csv": "",
+                "c.csv": "date,no,lat,lon,num\n2020/8/20,0,,,\n",
+                "d.txt": "date,no,lat,lon,num\n2020/8/20,0,,,\n",
+            },
+            [{"path": "c.csv", "lines": [2]}],
+        ),
+        (
+            {
+                "a.csv": "date,no,lat,lon,num\n"
+                "\u0662\u0660\u0662\u0660/8/20,0,,,\n"
+                "2020/8/20,0,,,\n"
+            },
+            [{"path": "a.csv", "lines": [3]}],
+        ),
+    ],
+)
+def test_finder(
+    tmp_path: Path,
+    in_files: dict[str, str],
+    out_result: list[dict[str, str | list[int]]],
+) -> None:
+    for name, text in in_files.items():
+        (tmp_path / name).write_text(text)
+    result = finder.finder(tmp_path, 2020, 8, 20)
+    out = sorted(
+        ({"path": Path(r.path).name, "lines": r.lines} for r in result),
+        key=lambda r: str(r["path"]),
+    )
+    assert out == out_result
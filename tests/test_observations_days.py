@@ -238,6 +238,7 @@ def test_calc_monthly_obs(
     assert_frame_equal(df_out, df_expected)
 
 
+@pytest.mark.slow
 def test_draw_monthly_obs_days() -> None:
     df = pl.DataFrame(
         {
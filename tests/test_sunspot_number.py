@@ -461,6 +461,7 @@ def test_agg_monthly(
     assert_frame_equal(df_out, df_expected)
 
 
+@pytest.mark.slow
 def test_draw_sunspot_number_whole_disk() -> None:
     df = pl.DataFrame(
         {
@@ -506,6 +507,7 @@ def test_draw_sunspot_number_whole_disk() -> None:
     _ = sunspot_number.draw_sunspot_number_whole_disk(df, config)
 
 
+@pytest.mark.slow
 def test_draw_sunspot_number_hemispheric() -> None:
     df = pl.DataFrame(
         {
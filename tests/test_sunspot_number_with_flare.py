@@ -1,4 +1,5 @@
 from datetime import date
+from io import StringIO
 from pathlib import Path
 
 import polars as pl
@@ -173,8 +174,7 @@ def test_load_flare_file(
     out_date: list[date],
     out_index: list[float],
 ) -> None:
-    m = mocker.mock_open(read_data=in_text)
-    mocker.patch("pathlib.Path.open", m)
+    mocker.patch("pathlib.Path.open", return_value=StringIO(in_text))
 
     df_expected = pl.DataFrame(
         {"date": out_date, "index": out_index},
@@ -187,8 +187,7 @@ def test_load_flare_file(
 
 
 def test_load_flare_file_with_error(mocker: MockerFixture) -> None:
-    m = mocker.mock_open(read_data="")
-    mocker.patch("pathlib.Path.open", m)
+    mocker.patch("pathlib.Path.open", return_value=StringIO(""))
 
     with pytest.raises(ValueError, match="cannot find year"):
         _ = sunspot_number_with_flare.load_flare_file(Path("dummy/path"))
@@ -201,78 +200,62 @@ def _create_df(dt: date, v: float) -> pl.DataFrame:
     )
 
 
+_FILES_NORTH = tuple(Path(f"north_{year}") for year in range(2010, 2012))
+_FILES_SOUTH = tuple(Path(f"south_{year}") for year in range(2010, 2012))
+_FILES_TOTAL = tuple(Path(f"total_{year}") for year in range(2011, 2013))
+
+# north, south, totalの順に読み込まれる各ファイルのデータ
+_DFS_FLARE_FILE = (
+    _create_df(date(2010, 1, 1), 1.2),
+    _create_df(date(2011, 1, 1), 2.3),
+    _create_df(date(2010, 1, 1), 12.3),
+    _create_df(date(2011, 1, 1), 23.4),
+    _create_df(date(2011, 1, 1), 12),
+    _create_df(date(2012, 1, 1), 23),
+)
+
+_DF_FLARE_EXPECTED = pl.DataFrame(
+    {
+        "date": [date(2010, 1, 1), date(2011, 1, 1), date(2012, 1, 1)],
+        "north": [1.2, 2.3, None],
+        "south": [12.3, 23.4, None],
+        "total": [None, 12, 23],
+    },
+    schema={
+        "date": pl.Date,
+        "north": pl.Float64,
+        "south": pl.Float64,
+        "total": pl.Float64,
+    },
+)
+
+
 def test_load_flare_files(mocker: MockerFixture) -> None:
-    files_north = [Path(f"north_{year}") for year in range(2010, 2012)]
-    files_south = [Path(f"south_{year}") for year in range(2010, 2012)]
-    files_total = [Path(f"total_{year}") for year in range(2011, 2013)]
     mocker.patch(
         "seiryo_sunspot_lib.sunspot_number_with_flare.load_flare_file",
-        side_effect=[
-            _create_df(date(2010, 1, 1), 1.2),
-            _create_df(date(2011, 1, 1), 2.3),
-            _create_df(date(2010, 1, 1), 12.3),
-            _create_df(date(2011, 1, 1), 23.4),
-            _create_df(date(2011, 1, 1), 12),
-            _create_df(date(2012, 1, 1), 23),
-        ],
-    )
-    df_expected = pl.DataFrame(
-        {
-            "date": [date(2010, 1, 1), date(2011, 1, 1), date(2012, 1, 1)],
-            "north": [1.2, 2.3, None],
-            "south": [12.3, 23.4, None],
-            "total": [None, 12, 23],
-        },
-        schema={
-            "date": pl.Date,
-            "north": pl.Float64,
-            "south": pl.Float64,
-            "total": pl.Float64,
-        },
+        side_effect=list(_DFS_FLARE_FILE),
     )
     df_out = sunspot_number_with_flare.load_flare_files(
-        files_north, files_south, files_total
+        list(_FILES_NORTH), list(_FILES_SOUTH), list(_FILES_TOTAL)
     )
-    assert_frame_equal(df_out, df_expected, check_column_order=False)
+    assert_frame_equal(df_out, _DF_FLARE_EXPECTED, check_column_order=False)
 
 
 def test_load_flare_data(mocker: MockerFixture) -> None:
     mocker.patch(
         "pathlib.Path.glob",
         side_effect=[
-            (Path(f"north_{year}") for year in range(2010, 2012)),
-            (Path(f"south_{year}") for year in range(2010, 2012)),
-            (Path(f"total_{year}") for year in range(2011, 2013)),
+            iter(_FILES_NORTH),
+            iter(_FILES_SOUTH),
+            iter(_FILES_TOTAL),
         ],
     )
     mocker.patch(
         "seiryo_sunspot_lib.sunspot_number_with_flare.load_flare_file",
-        side_effect=[
-            _create_df(date(2010, 1, 1), 1.2),
-            _create_df(date(2011, 1, 1), 2.3),
-            _create_df(date(2010, 1, 1), 12.3),
-            _create_df(date(2011, 1, 1), 23.4),
-            _create_df(date(2011, 1, 1), 12),
-            _create_df(date(2012, 1, 1), 23),
-        ],
-    )
-    df_expected = pl.DataFrame(
-        {
-            "date": [date(2010, 1, 1), date(2011, 1, 1), date(2012, 1, 1)],
-            "north": [1.2, 2.3, None],
-            "south": [12.3, 23.4, None],
-            "total": [None, 12, 23],
-        },
-        schema={
-            "date": pl.Date,
-            "north": pl.Float64,
-            "south": pl.Float64,
-            "total": pl.Float64,
-        },
+        side_effect=list(_DFS_FLARE_FILE),
     )
     df_out = sunspot_number_with_flare.load_flare_data(Path("bummy/path"))
-    print(df_out)
-    assert_frame_equal(df_out, df_expected, check_column_order=False)
+    assert_frame_equal(df_out, _DF_FLARE_EXPECTED, check_column_order=False)
 
 
 @pytest.mark.parametrize(
@@ -456,7 +439,9 @@ def test_calc_factors() -> None:
     _ = sunspot_number_with_flare.calc_factors(in_df)
 
 
-def test_draw_sunspot_number_with_flare() -> None:
+@pytest.mark.slow
+@pytest.mark.parametrize("in_factor", [pytest.param(None), pytest.param(1.0)])
+def test_draw_sunspot_number_with_flare(in_factor: float | None) -> None:
     df = pl.DataFrame(
         {
             "date": [date(2020, 2, 1), date(2020, 3, 1), date(2020, 4, 1)],
@@ -520,13 +505,19 @@ def test_draw_sunspot_number_with_flare() -> None:
         ),
         legend=Legend(font_family="Times New Roman", font_size=12),
     )
-    _ = sunspot_number_with_flare.draw_sunspot_number_with_flare(df, config)
     _ = sunspot_number_with_flare.draw_sunspot_number_with_flare(
-        df, config, factor=1.0
+        df, config, factor=in_factor
     )
 
 
-def test_draw_sunspot_number_with_flare_hemispheric() -> None:
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    ("in_factor_north", "in_factor_south"),
+    [pytest.param(None, None), pytest.param(1.0, 1.0)],
+)
+def test_draw_sunspot_number_with_flare_hemispheric(
+    in_factor_north: float | None, in_factor_south: float | None
+) -> None:
     df = pl.DataFrame(
         {
             "date": [date(2020, 2, 1), date(2020, 3, 1), date(2020, 4, 1)],
@@ -634,8 +625,5 @@ def test_draw_sunspot_number_with_flare_hemispheric() -> None:
         legend_south=Legend(font_family="Times New Roman", font_size=12),
     )
     _ = sunspot_number_with_flare.draw_sunspot_number_with_flare_hemispheric(
-        df, config
-    )
-    _ = sunspot_number_with_flare.draw_sunspot_number_with_flare_hemispheric(
-        df, config, factor_north=1.0, factor_south=1.0
+        df, config, factor_north=in_factor_north, factor_south=in_factor_south
     )
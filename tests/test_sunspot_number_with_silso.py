@@ -322,6 +322,7 @@ def test_calc_r2() -> None:
     assert r2_out == pytest.approx(1.0)
 
 
+@pytest.mark.slow
 def test_draw_sunspot_number_with_silso() -> None:
     df = pl.DataFrame(
         {
@@ -376,6 +377,7 @@ def test_draw_sunspot_number_with_silso() -> None:
     _ = sunspot_number_with_silso.draw_sunspot_number_with_silso(df, config)
 
 
+@pytest.mark.slow
 def test_draw_scatter() -> None:
     df = pl.DataFrame(
         {
@@ -444,6 +446,7 @@ def test_draw_scatter() -> None:
     _ = sunspot_number_with_silso.draw_scatter(df, factor, r2, config)
 
 
+@pytest.mark.slow
 def test_draw_ratio() -> None:
     df = pl.DataFrame(
         {
@@ -497,6 +500,7 @@ def test_draw_ratio() -> None:
     _ = sunspot_number_with_silso.draw_ratio(df, factor, config)
 
 
+@pytest.mark.slow
 def test_draw_diff() -> None:
     df = pl.DataFrame(
         {
@@ -542,6 +546,7 @@ def test_draw_diff() -> None:
     _ = sunspot_number_with_silso.draw_diff(df, config)
 
 
+@pytest.mark.slow
 def test_draw_ratio_and_diff_1() -> None:
     df = pl.DataFrame(
         {
@@ -618,6 +623,7 @@ def test_draw_ratio_and_diff_1() -> None:
     _ = sunspot_number_with_silso.draw_ratio_diff_1(df, factor, config)
 
 
+@pytest.mark.slow
 def test_draw_ratio_and_diff_2() -> None:
     df = pl.DataFrame(
         {